@@ -0,0 +1,79 @@
+# Currency lookup table for the salary predictor app.
+# Kept out of app.py so it is built once at import time instead of on every Streamlit rerun.
+
+from functools import lru_cache
+
+# --- Currency Conversion Rates (Examples) ---
+# This is a simplified approach. For a production app, you'd use a real-time API.
+# Rates are relative to USD.
+USD_TO_INR_RATE = 83.5
+USD_TO_EUR_RATE = 0.92  # 1 USD = 0.92 EUR
+USD_TO_GBP_RATE = 0.79  # 1 USD = 0.79 GBP
+USD_TO_CAD_RATE = 1.37  # 1 USD = 1.37 CAD
+USD_TO_AUD_RATE = 1.50  # 1 USD = 1.50 AUD
+USD_TO_JPY_RATE = 157.0 # 1 USD = 157.0 JPY
+USD_TO_CHF_RATE = 0.89  # 1 USD = 0.89 CHF
+
+# Mapping of country codes to (symbol, currency name, rate from USD, rate from USD to INR)
+# Tuples are unpacked directly in the prediction path, so a single lookup yields every scalar needed.
+CURRENCIES = {
+    "US": ("$", "USD", 1.0, USD_TO_INR_RATE),
+    "GB": ("£", "GBP", USD_TO_GBP_RATE, USD_TO_INR_RATE),
+    "CA": ("C$", "CAD", USD_TO_CAD_RATE, USD_TO_INR_RATE),
+    "DE": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "IN": ("₹", "INR", USD_TO_INR_RATE, USD_TO_INR_RATE),
+    "FR": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "ES": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "AU": ("A$", "AUD", USD_TO_AUD_RATE, USD_TO_INR_RATE),
+    "BR": ("R$", "BRL", 5.40, USD_TO_INR_RATE), # Example rate
+    "NL": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "JP": ("¥", "JPY", USD_TO_JPY_RATE, USD_TO_INR_RATE),
+    "CH": ("CHF", "CHF", USD_TO_CHF_RATE, USD_TO_INR_RATE),
+    "IT": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "PL": ("zł", "PLN", 4.05, USD_TO_INR_RATE), # Example rate
+    "PT": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "MX": ("$", "MXN", 18.0, USD_TO_INR_RATE), # Example rate
+    "DK": ("kr", "DKK", 6.90, USD_TO_INR_RATE), # Example rate
+    "GR": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "TR": ("₺", "TRY", 32.5, USD_TO_INR_RATE), # Example rate
+    "AT": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "BE": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "IE": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "LU": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "NG": ("₦", "NGN", 1500.0, USD_TO_INR_RATE), # Example rate
+    "PK": ("₨", "PKR", 278.0, USD_TO_INR_RATE), # Example rate
+    "RU": ("₽", "RUB", 87.0, USD_TO_INR_RATE), # Example rate
+    "SG": ("S$", "SGD", 1.35, USD_TO_INR_RATE), # Example rate
+    "UA": ("₴", "UAH", 40.0, USD_TO_INR_RATE), # Example rate
+    "AE": ("د.إ", "AED", 3.67, USD_TO_INR_RATE), # Example rate
+    "CL": ("CLP", "CLP", 930.0, USD_TO_INR_RATE), # Example rate
+    "CO": ("$", "COP", 4000.0, USD_TO_INR_RATE), # Example rate
+    "CY": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "CZ": ("Kč", "CZK", 23.0, USD_TO_INR_RATE), # Example rate
+    "EE": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "FI": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "GH": ("₵", "GHS", 15.0, USD_TO_INR_RATE), # Example rate
+    "HR": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "HU": ("Ft", "HUF", 360.0, USD_TO_INR_RATE), # Example rate
+    "IR": ("﷼", "IRR", 42000.0, USD_TO_INR_RATE), # Example rate
+    "MT": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "NZ": ("NZ$", "NZD", 1.63, USD_TO_INR_RATE), # Example rate
+    "PH": ("₱", "PHP", 58.0, USD_TO_INR_RATE), # Example rate
+    "PR": ("$", "USD", 1.0, USD_TO_INR_RATE), # Puerto Rico uses USD
+    "RO": ("lei", "RON", 4.60, USD_TO_INR_RATE), # Example rate
+    "SI": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "SK": ("€", "EUR", USD_TO_EUR_RATE, USD_TO_INR_RATE),
+    "TH": ("฿", "THB", 36.0, USD_TO_INR_RATE), # Example rate
+    "VN": ("₫", "VND", 25400.0, USD_TO_INR_RATE), # Example rate
+    # Add more countries and their currency symbols/rates as needed
+}
+
+# Fallback used for locations missing from CURRENCIES
+DEFAULT_CURRENCY = ("$", "USD", 1.0, USD_TO_INR_RATE)
+
+
+# Formatted amounts are memoized on integer cents. This lives here rather than in app.py because
+# Streamlit re-executes app.py on every rerun, which would start a fresh cache each time.
+@lru_cache(maxsize=4096)
+def format_currency(cents, symbol):
+    return f"{symbol}{cents / 100:,.2f}"
@@ -1,17 +1,48 @@
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.preprocessing import OneHotEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.impute import SimpleImputer # Make sure this is imported
 import joblib # To save and load the model
+from joblib import Memory
+import os
+
+# On-disk cache for the CSV load and the fitted preprocessor, so retraining while tuning the
+# regressor skips the repeated parsing and fit_transform work
+memory = Memory(location=os.environ.get('CACHE_DIR', '.cache'), verbose=0)
 
 # --- 1. Load the Dataset ---
+# Define features (X) and target (y) for the new dataset
+# Adjust these column names to match 'ds_salaries.csv' exactly.
+# We'll use 'experience_level' (categorical), 'job_title' (categorical),
+# 'company_location' (categorical), 'remote_ratio' (numerical), and 'work_year' (numerical)
+# as features. 'salary_in_usd' is the target.
+
+features = ['experience_level', 'job_title', 'company_location', 'remote_ratio', 'work_year']
+target = 'salary_in_usd'
+
+@memory.cache
+def load_dataset(path, mtime, usecols):
+    # mtime and usecols are part of the cache key, so an edited CSV or feature list is re-read instead of served stale
+    # Only parse the columns we use, with the multithreaded pyarrow parser.
+    # Downcast numeric columns up front: halves the bytes moved through preprocessing and tree split scans
+    return pd.read_csv(path, usecols=usecols, engine='pyarrow',
+                       dtype={'remote_ratio': 'int16', 'work_year': 'int16', 'salary_in_usd': 'float32'})
+
 # IMPORTANT: Changed to 'ds_salaries.csv'. Make sure you have this file in your directory.
 try:
-    df = pd.read_csv('ds_salaries.csv')
+    # Check if all required columns exist before parsing the file (reads the header only)
+    header = pd.read_csv('ds_salaries.csv', nrows=0).columns
+    missing_cols = [col for col in features + [target] if col not in header]
+    if missing_cols:
+        print(f"\nError: The following required columns are missing from your dataset: {missing_cols}")
+        print("Please adjust the 'features' and 'target' lists in the script to match your dataset's column names.")
+        exit()
+
+    df = load_dataset('ds_salaries.csv', os.path.getmtime('ds_salaries.csv'), features + [target])
     print("Dataset 'ds_salaries.csv' loaded successfully!")
     print(f"Dataset shape before handling NaNs: {df.shape}")
     print("\nFirst 5 rows of the dataset:")
@@ -39,22 +70,7 @@ print(df.isnull().sum())
 
 # --- 4. Data Preprocessing ---
 
-# Define features (X) and target (y) for the new dataset
-# Adjust these column names to match 'ds_salaries.csv' exactly.
-# We'll use 'experience_level' (categorical), 'job_title' (categorical),
-# 'company_location' (categorical), 'remote_ratio' (numerical), and 'work_year' (numerical)
-# as features. 'salary_in_usd' is the target.
-
-features = ['experience_level', 'job_title', 'company_location', 'remote_ratio', 'work_year']
-target = 'salary_in_usd'
-
-# Check if all required columns exist in the DataFrame
-missing_cols = [col for col in features + [target] if col not in df.columns]
-if missing_cols:
-    print(f"\nError: The following required columns are missing from your dataset: {missing_cols}")
-    print("Please adjust the 'features' and 'target' lists in the script to match your dataset's column names.")
-    exit()
-
+# Features and target are defined in section 1 so only those columns are read from the CSV
 X = df[features]
 y = df[target]
 
@@ -63,16 +79,17 @@ numerical_features = ['remote_ratio', 'work_year'] # 'work_year' can be treated
 categorical_features = ['experience_level', 'job_title', 'company_location']
 
 # Handle potential NaNs in features (if any remain after dropping target NaNs)
-# For numerical features, we'll impute with the mean
+# For numerical features, we'll impute with the mean (no scaling needed, tree models are scale-invariant)
 # For categorical features, we'll impute with the most frequent value (mode)
 numerical_transformer = Pipeline(steps=[
-    ('imputer', SimpleImputer(strategy='mean')),
-    ('scaler', StandardScaler())
+    ('imputer', SimpleImputer(strategy='mean'))
 ])
 
 categorical_transformer = Pipeline(steps=[
     ('imputer', SimpleImputer(strategy='most_frequent')),
-    ('onehot', OneHotEncoder(handle_unknown='ignore'))
+    # Dense one-hot input: HGBR's native categorical splits overfit the high-cardinality
+    # job_title/company_location columns on this small dataset
+    ('onehot', OneHotEncoder(handle_unknown='ignore', sparse_output=False)) # HGBR needs dense input
 ])
 
 # Create a column transformer for preprocessing
@@ -89,8 +106,12 @@ preprocessor = ColumnTransformer(
 # Create a pipeline that first preprocesses the data and then trains the model
 model_pipeline = Pipeline(steps=[
     ('preprocessor', preprocessor),
-    ('regressor', RandomForestRegressor(n_estimators=100, random_state=42)) # Using RandomForestRegressor
-])
+    # Histogram-based boosting: shallower trees, smaller pickle and faster per-row predict than a RandomForest
+    # Early stopping keeps only the boosting iterations that still improve validation loss,
+    # so the saved model holds fewer trees (smaller pickle, faster load)
+    ('regressor', HistGradientBoostingRegressor(max_iter=200, learning_rate=0.05, max_depth=8,
+                                                early_stopping=True, n_iter_no_change=20, random_state=42))
+], memory=memory) # Caches the fitted preprocessor keyed on its params and X_train, so only the regressor refits
 
 # Split data into training and testing sets
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -99,6 +120,17 @@ print("\nTraining the model...")
 model_pipeline.fit(X_train, y_train)
 print("Model training complete!")
 
+# Precompute {category: regressor input column} lookups from the fitted encoder so app.py can encode
+# a single row with plain dict lookups instead of going through the OneHotEncoder at predict time.
+# The ColumnTransformer outputs the numerical columns first, then each feature's one-hot block in turn.
+onehot_encoder = model_pipeline.named_steps['preprocessor'].named_transformers_['cat'].named_steps['onehot']
+model_pipeline.cat_index = {}
+offset = len(numerical_features)
+for col, categories in zip(categorical_features, onehot_encoder.categories_):
+    model_pipeline.cat_index[col] = {category: offset + i for i, category in enumerate(categories)}
+    offset += len(categories)
+print(f"Boosting iterations kept: {model_pipeline.named_steps['regressor'].n_iter_}")
+
 # --- 6. Evaluate the Model ---
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 
@@ -114,7 +146,10 @@ print(f"Root Mean Squared Error (RMSE): ${rmse:,.2f}")
 
 # --- 7. Save the Trained Model ---
 model_filename = 'salary_prediction_model.pkl'
-joblib.dump(model_pipeline, model_filename)
+# The joblib cache is training-only; don't ship a Memory pointing at this machine's cache directory
+model_pipeline.set_params(memory=None)
+# zlib level 3 keeps the artifact small without adding a compression dependency
+joblib.dump(model_pipeline, model_filename, compress=3)
 print(f"\nModel saved successfully as '{model_filename}'")
 
 print("\nNow, update your Streamlit app (app.py) to reflect the new input features!")